@@ -59,3 +59,6 @@ CREATE TABLE IF NOT EXISTS order_items
     total_price NUMERIC(12, 2) GENERATED ALWAYS AS (quantity * unit_price) STORED,
     created_at  TIMESTAMPTZ    NOT NULL DEFAULT now()
 );
+
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_order_items_order_variant ON order_items (order_id, variant_id);